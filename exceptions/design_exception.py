@@ -4,3 +4,19 @@ class DrawWithoutDesignException(Exception):
 
     def __str__(self):
         return f'DesignException: {self.message}'
+
+
+class SimulateWithoutDesignException(Exception):
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return f'DesignException: {self.message}'
+
+
+class SimulationParameterException(Exception):
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return f'DesignException: {self.message}'
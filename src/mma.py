@@ -1,9 +1,13 @@
+import numbers
+
 import numpy as np
 from PIL import Image, ImageDraw
 import pandas as pd
 from resources.log_config import logger
 
-from exceptions.design_exception import DrawWithoutDesignException
+from exceptions.design_exception import DrawWithoutDesignException, SimulateWithoutDesignException, \
+    SimulationParameterException
+from src.transient import simulate_slew
 
 
 def process_kwargs(kwargs, variable_name, default_value):
@@ -49,6 +53,8 @@ class Mma:
         self.I_sat = None  # Corrente de saturação
         self.I_b = None  # Corrente de base
         self.N = None  # Número de voltas na espira
+        self.L_n = None  # Indutância normalizada (por espira ao quadrado) de um par de polos
+        self.K_in = None  # Ganho de corrente normalizado (por espira ao quadrado) de um par de polos
 
         # Constantes
         self.mu_0 = 4 * np.pi * 1e-7
@@ -176,9 +182,9 @@ class Mma:
         # Computação das características do bobinado
         logger.info('Iniciando computação das características do bobinado...')
         self.df_dt_max = self.f_y_0 * self.omega_max * (2 * np.pi / 60)
-        L_n = (2 * self.mu_0 * self.A_g) / self.g_0
-        K_in = (4 * self.mu_0 * self.A_g * np.cos(np.deg2rad(22.5))) / self.g_0 ** 2
-        self.I_sat = ((L_n * self.df_dt_max) / (self.alpha * self.V * K_in))
+        self.L_n = (2 * self.mu_0 * self.A_g) / self.g_0
+        self.K_in = (4 * self.mu_0 * self.A_g * np.cos(np.deg2rad(22.5))) / self.g_0 ** 2
+        self.I_sat = ((self.L_n * self.df_dt_max) / (self.alpha * self.V * self.K_in))
         self.I_b = self.alpha * self.I_sat
         self.N = np.ceil((B_sat * self.g_0) / (self.mu_0 * self.I_sat))
         logger.info(f'df_dt_max = {self.df_dt_max:.2f} N/s')
@@ -198,6 +204,29 @@ class Mma:
         logger.info('Processo de dimensionamento concluído com sucesso.')
         return self.A_g, self.A_c, self.r_j, self.w, self.l, self.r_c, self.r_s, result_df
 
+    def simulate(self, **kwargs):
+        if not self.design_done:
+            logger.error('O dimensionamento ainda não foi realizado!')
+            raise SimulateWithoutDesignException('O dimensionamento precisa ser realizado antes que o MMA possa ser '
+                                                 'simulado.')
+
+        # Processamento de argumentos
+        if 'omega' in kwargs:
+            omega = kwargs['omega']
+        else:
+            n_speeds = process_kwargs(kwargs, 'n_speeds', 10)
+            if not isinstance(n_speeds, numbers.Integral) or isinstance(n_speeds, bool) or n_speeds < 1:
+                logger.error('Número de rotações inválido para a simulação transitória!')
+                raise SimulationParameterException('n_speeds deve ser um inteiro maior ou igual a 1.')
+            omega = np.linspace(self.omega_max / n_speeds, self.omega_max, n_speeds)
+        R = process_kwargs(kwargs, 'R', 0.0)
+        n_steps = process_kwargs(kwargs, 'n_steps', 1000)
+        n_periods = process_kwargs(kwargs, 'n_periods', 1)
+        tol = process_kwargs(kwargs, 'tol', 1e-9)
+
+        return simulate_slew(self.L_n, self.K_in, self.I_b, self.I_sat, self.N, self.V, self.f_y_0, omega, R=R,
+                             n_steps=n_steps, n_periods=n_periods, tol=tol)
+
     def draw(self, img_count, scale=100):
         if not self.design_done:
             logger.error('O dimensionamento ainda não foi realizado!')
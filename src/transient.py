@@ -0,0 +1,139 @@
+import numbers
+
+import numpy as np
+import pandas as pd
+from resources.log_config import logger
+
+from exceptions.design_exception import SimulationParameterException
+
+MIN_STEPS = 8  # Menor número de passos por período que ainda representa a referência senoidal
+
+
+def _force(i, K_i, I_b):
+    # Força do par de bobinas com amplificadores unipolares: a bobina oposta é desligada quando |i| > I_b
+    return (K_i / (4 * I_b)) * (np.maximum(I_b + i, 0) ** 2 - np.maximum(I_b - i, 0) ** 2)
+
+
+def _current(f, K_i, I_b):
+    # Inversa de _force: linear até |f| = K_i * I_b e com uma única bobina acima disso
+    f_abs = np.abs(f)
+    i_abs = np.where(f_abs <= K_i * I_b, f_abs / K_i, np.sqrt(4 * I_b * f_abs / K_i) - I_b)
+    return np.sign(f) * i_abs
+
+
+def _is_count(value, minimum):
+    return isinstance(value, numbers.Integral) and not isinstance(value, bool) and value >= minimum
+
+
+def simulate_slew(L_n, K_in, I_b, I_sat, N, V, f_amp, omega, R=0.0, n_steps=1000, n_periods=1, tol=1e-9):
+    """
+    Simula a corrente de controle e a força de vários projetos de mancal (parâmetros escalares ou vetores com um valor
+    por projeto) submetidos à força de referência f_amp * sin(omega * t), para cada rotação de omega (rpm).
+    """
+    # Validação dos parâmetros de simulação
+    if not _is_count(n_steps, MIN_STEPS) or not _is_count(n_periods, 1):
+        logger.error('Discretização inválida para a simulação transitória!')
+        raise SimulationParameterException(f'n_steps deve ser um inteiro maior ou igual a {MIN_STEPS} e n_periods um '
+                                           'inteiro maior ou igual a 1.')
+    try:
+        omega = np.atleast_1d(np.asarray(omega, dtype=float))
+        params = [np.atleast_1d(np.asarray(p, dtype=float)) for p in (L_n, K_in, I_b, I_sat, N, V, f_amp, R)]
+    except (TypeError, ValueError):
+        logger.error('Parâmetros não numéricos na simulação transitória!')
+        raise SimulationParameterException('Os parâmetros da simulação devem ser numéricos.')
+    if omega.ndim != 1 or omega.size == 0 or np.any(~(omega > 0)):
+        logger.error('Rotações inválidas para a simulação transitória!')
+        raise SimulationParameterException('As rotações simuladas devem ser positivas.')
+    if np.any(~(params[6] > 0)):
+        logger.error('Amplitude de força inválida para a simulação transitória!')
+        raise SimulationParameterException('A amplitude da força de referência deve ser positiva.')
+    sizes = {p.size for p in params if p.size != 1}
+    if any(p.ndim != 1 for p in params) or len(sizes) > 1:
+        logger.error('Parâmetros de projeto com dimensões incompatíveis!')
+        raise SimulationParameterException('Os parâmetros de projeto devem ser escalares ou vetores de mesmo '
+                                           'comprimento.')
+    n_designs = sizes.pop() if sizes else 1
+
+    # Estados organizados como (projetos x rotações)
+    L_n, K_in, I_b, I_sat, N, V, f_amp, R = (np.broadcast_to(p, (n_designs,))[:, None] for p in params)
+    w = (omega * (2 * np.pi / 60))[None, :]
+    shape = (n_designs, w.shape[1])
+    logger.info(f'Iniciando simulação transitória de {shape[0]} projeto(s) em {shape[1]} rotação(ões)...')
+
+    # Características do bobinado (indutância constante, inclusive na operação com uma única bobina)
+    L = N ** 2 * L_n  # Indutância da bobina
+    K_i = N ** 2 * K_in * I_b  # Ganho de corrente linearizado em torno da corrente de base
+    k_f = K_i / (4 * I_b)  # Constante de força de cada bobina
+    i_max = I_sat - I_b  # Corrente de controle máxima antes da saturação
+    dt_L = 2 * np.pi / (w * n_steps) / L  # Passo de integração dividido pela indutância
+
+    # Como o passo é uma fração fixa do período, a referência depende apenas do índice do passo
+    sin_phase = np.sin(2 * np.pi * np.arange(n_steps * n_periods + 1) / n_steps)
+
+    i = np.zeros(shape)  # Corrente de controle
+    v_avail = np.empty(shape)  # Tensão disponível para variar a corrente
+    di_max = np.empty(shape)  # Variação de corrente permitida pela tensão no passo
+    di = np.empty(shape)
+    ratio = np.empty(shape)
+    margin = np.full(shape, np.inf)  # Menor razão entre a variação de corrente disponível e a da referência
+    v_min = np.full(shape, np.inf)  # Menor tensão disponível
+    f_error = np.zeros(shape)  # Maior erro absoluto de força
+    i_ref = _current(f_amp * sin_phase[0], K_i, I_b)
+
+    for k in range(n_steps * n_periods):
+        f_ref_next = f_amp * sin_phase[k + 1]
+        i_ref_next = _current(f_ref_next, K_i, I_b)
+
+        # Tensão disponível para variar a corrente após a queda resistiva
+        np.abs(i, out=v_avail)
+        v_avail += I_b
+        v_avail *= -R
+        v_avail += V
+        np.maximum(v_avail, 0, out=v_avail)
+        np.minimum(v_min, v_avail, out=v_min)
+        np.multiply(v_avail, dt_L, out=di_max)
+
+        # Margem de taxa de variação limitada pela tensão, frente à variação da referência no passo
+        if sin_phase[k + 1] != sin_phase[k]:
+            np.divide(di_max, np.abs(i_ref_next - i_ref), out=ratio)
+            np.minimum(margin, ratio, out=margin)
+        i_ref = i_ref_next
+
+        # Integração de passo fixo da corrente com tensão limitada a V (amplificador deadbeat)
+        np.subtract(i_ref_next, i, out=di)
+        np.negative(di_max, out=ratio)
+        np.clip(di, ratio, di_max, out=di)
+        i += di
+        np.clip(i, -i_max, i_max, out=i)
+
+        # Erro de força, com a bobina oposta desligada quando |i| > I_b
+        np.add(I_b, i, out=di)
+        np.maximum(di, 0, out=di)
+        di *= di
+        np.subtract(I_b, i, out=ratio)
+        np.maximum(ratio, 0, out=ratio)
+        ratio *= ratio
+        di -= ratio
+        di *= k_f
+        di -= f_ref_next
+        np.abs(di, out=di)
+        np.maximum(f_error, di, out=f_error)
+
+    worst = np.argmin(margin, axis=1)
+    slew_margin = margin[np.arange(n_designs), worst] - 1
+    current_margin = (_force(i_max, K_i, I_b) / f_amp - 1)[:, 0]
+    f_error_abs = f_error.max(axis=1)
+    result_df = pd.DataFrame({
+        'df_dt_max': f_amp[:, 0] * w.max(),
+        'df_dt_min': (K_i * v_min / L).min(axis=1),
+        'slew_margin': slew_margin,
+        'current_margin': current_margin,
+        'omega_critico': omega[worst],
+        'f_error_abs': f_error_abs,
+        'f_error': f_error_abs / f_amp[:, 0],
+        # Projetos de Mma.design ficam exatamente no limite de tensão, então -tol absorve o arredondamento
+        'atende': (slew_margin >= -tol) & (current_margin >= -tol),
+    })
+    logger.info(f'Simulação transitória concluída: {np.sum(~result_df["atende"])} projeto(s) não atendem à '
+                f'exigência de força.')
+    return result_df
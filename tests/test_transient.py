@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from exceptions.design_exception import SimulateWithoutDesignException, SimulationParameterException
+from src.mma import Mma
+from src.transient import simulate_slew
+
+
+def build_mma(**kwargs):
+    params = dict(C=np.matrix('1, 0, 1; 0, -1, -1; 0, 1, 1; 1, 0, -1; -1, 0, 1; 0, 1, -1; 0, -1, 1;-1 0 -1'),
+                  g_0=0.001, B_b=0.6, r_r=0.04, f_i=0.3697, f_x_0=0, f_y_0=500, f_x_s=75, f_y_s=75, gamma=1,
+                  omega_max=1000, V=12, alpha=0.5, eta=1, f_c=0.5, J_max=600e4, beta_A_c=0.1, beta_r_j=0.1)
+    params.update(kwargs)
+    return Mma(**params)
+
+
+def designed_mma(**kwargs):
+    mma = build_mma(**kwargs)
+    mma.design()
+    return mma
+
+
+def test_designed_bearing_has_zero_margin_at_omega_max():
+    result = designed_mma().simulate(omega=[1000], n_steps=1000)
+    assert result['slew_margin'][0] == pytest.approx(0, abs=1e-4)
+    assert result['atende'][0]
+    assert result['f_error'][0] < 1e-9
+
+
+def test_random_designs_have_no_slew_shortfall():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        mma = designed_mma(f_y_0=rng.uniform(100, 1000), omega_max=rng.uniform(500, 20000), V=rng.uniform(5, 100),
+                           g_0=rng.uniform(5e-4, 2e-3), alpha=rng.uniform(0.2, 0.8))
+        assert (mma.simulate(n_steps=40)['slew_margin'] >= -1e-9).all()
+
+
+@pytest.mark.parametrize('alpha', [0.3, 0.45, 0.55, 0.7])
+def test_slew_margin_is_independent_of_alpha(alpha):
+    result = designed_mma(alpha=alpha).simulate(omega=[1000])
+    assert result['slew_margin'][0] == pytest.approx(0, abs=1e-4)
+
+
+def test_single_coil_operation_extends_force_below_half_alpha():
+    mma = designed_mma(alpha=0.3)
+    assert mma.I_sat - mma.I_b > mma.I_b
+    result = mma.simulate(omega=[1000])
+    assert result['current_margin'][0] >= 0
+    assert result['atende'][0]
+    assert result['f_error'][0] < 1e-6
+
+
+def test_resistance_or_overspeed_gives_negative_margin():
+    mma = designed_mma()
+    result = mma.simulate(R=0.5)
+    assert -0.2 < result['slew_margin'][0] < 0
+    assert not result['atende'][0]
+    assert result['f_error'][0] > 0
+    result = mma.simulate(omega=[1500])
+    assert result['slew_margin'][0] == pytest.approx(1000 / 1500 - 1, rel=1e-3)
+    assert not result['atende'][0]
+    assert result['f_error'][0] > 0
+
+
+def test_current_saturation_gives_negative_margin():
+    mma = designed_mma()
+    result = simulate_slew(mma.L_n, mma.K_in, mma.I_b, mma.I_sat, mma.N, 2 * mma.V, 2.5 * mma.f_y_0, [100])
+    assert result['slew_margin'][0] > 0
+    assert result['current_margin'][0] < 0
+    assert not result['atende'][0]
+    assert result['f_error_abs'][0] == pytest.approx(result['f_error'][0] * 2.5 * mma.f_y_0)
+    assert result['f_error'][0] > 0.1
+
+
+def test_batched_results_match_individual_runs():
+    mmas = [designed_mma(f_y_0=f_y_0, V=V) for f_y_0, V in [(300, 12), (500, 24), (800, 6)]]
+    omega = [200, 600, 1000]
+    R = [0.0, 0.3, 0.1]
+    batch = simulate_slew([m.L_n for m in mmas], [m.K_in for m in mmas], [m.I_b for m in mmas],
+                          [m.I_sat for m in mmas], [m.N for m in mmas], 12, [m.f_y_0 for m in mmas], omega, R=R,
+                          n_steps=200)
+    for j, m in enumerate(mmas):
+        single = simulate_slew(m.L_n, m.K_in, m.I_b, m.I_sat, m.N, 12, m.f_y_0, omega, R=R[j], n_steps=200)
+        np.testing.assert_allclose(batch.iloc[[j]].drop(columns='atende').to_numpy(dtype=float),
+                                   single.drop(columns='atende').to_numpy(dtype=float))
+        assert batch['atende'][j] == single['atende'][0]
+
+
+def test_simulate_without_design_raises():
+    with pytest.raises(SimulateWithoutDesignException):
+        build_mma().simulate()
+
+
+def test_mismatched_design_lengths_raise():
+    mma = designed_mma()
+    with pytest.raises(SimulationParameterException):
+        simulate_slew([mma.L_n, mma.L_n], mma.K_in, [mma.I_b] * 3, mma.I_sat, mma.N, mma.V, mma.f_y_0, [1000])
+
+
+@pytest.mark.parametrize('kwargs', [{'omega': [0, 500, 1000]}, {'omega': [-100]}, {'n_steps': 0},
+                                    {'n_periods': 0}, {'n_steps': 2.5}, {'n_steps': 1}, {'n_steps': 7},
+                                    {'n_steps': None}, {'n_periods': None}, {'n_speeds': 0},
+                                    {'n_speeds': 2.5}])
+def test_invalid_simulation_parameters_raise(kwargs):
+    with pytest.raises(SimulationParameterException):
+        designed_mma().simulate(**kwargs)
+
+
+def test_non_positive_force_amplitude_raises():
+    mma = designed_mma()
+    with pytest.raises(SimulationParameterException):
+        simulate_slew(mma.L_n, mma.K_in, mma.I_b, mma.I_sat, mma.N, mma.V, [mma.f_y_0, 0], [1000])
+
+
+def test_explicit_omega_ignores_n_speeds():
+    result = designed_mma().simulate(omega=[1000], n_speeds=0)
+    assert len(result) == 1